@@ -3,39 +3,78 @@
 
 import sys
 import json
-import copy
+import hashlib
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from distutils.version import LooseVersion
 
-import numpy as np
 import rospy
 import rospkg
 import actionlib
-import tf
 import tf2_ros
-from tf.transformations import quaternion_from_euler, quaternion_multiply
 import geometry_msgs.msg
 
 import beamngpy as bngpy
 import beamng_msgs.msg as bng_msgs
 import beamng_msgs.srv as bng_srv
 
-from beamng_control.publishers import VehiclePublisher, NetworkPublisher, get_sensor_publisher
+from beamng_control.publishers import VehiclePublisher, NetworkPublisher, get_sensor_publisher, BNG_IO_LOCK
 from beamng_control.sensorHelper import get_sensor
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 MIN_BNG_VERSION_REQUIRED = '0.18.0'
 NODE_NAME = 'beamng_control'
+_PKG_PATH = None
+
+
+def get_pkg_path():
+    global _PKG_PATH
+    if _PKG_PATH is None:
+        _PKG_PATH = rospkg.RosPack().get_path(NODE_NAME)
+    return _PKG_PATH
+
+
+@lru_cache(maxsize=None)
+def sensor_quaternion(pitch, yaw):
+    # closed form of quaternion_from_euler(0, pitch, yaw), the alignment
+    # quaternion (0, 0, 0, 1) is the identity and drops out of the product.
+    # The result is a unit quaternion by construction, no need to normalize.
+    cp, sp = math.cos(pitch * 0.5), math.sin(pitch * 0.5)
+    cy, sy = math.cos(yaw * 0.5), math.sin(yaw * 0.5)
+    return -sp * sy, sp * cy, cp * sy, cp * cy
 
 
 def load_json(file_name):
-    pkg_path = rospkg.RosPack().get_path(NODE_NAME)
     file_path = Path(file_name).resolve()
-    relative_fp = Path(str(pkg_path) + '/' + str(file_path))
+    # paths such as '/config/sensors.json' are relative to the package root
+    relative_fp = Path(get_pkg_path()) / str(file_name).lstrip('/')
     if not file_path.is_file() and relative_fp.is_file():
         file_path = relative_fp
-    with file_path.open('r') as fh:
-        content = json.load(fh)
-    return content
+    return json_loads(file_path.read_bytes())
+
+
+def partition_sensor_specs(v_spec):
+    """
+    Splits the classical and automation sensor specifications of a vehicle
+    into base sensors and noise sensors, the latter being recognized by
+    their 'base sensor' entry. Returns a dict mapping the sensor kind to a
+    (base sensors, noise sensors) tuple, the vehicle spec is left untouched.
+    """
+    partition = dict()
+    for kind in ('sensors_classical', 'sensors_automation'):
+        base_sensors = list()
+        noise_sensors = list()
+        for spec in v_spec.get(kind, []):
+            (noise_sensors if 'base sensor' in spec else base_sensors).append(spec)
+        partition[kind] = (base_sensors, noise_sensors)
+    return partition
 
 
 class BeamNGBridge(object):
@@ -55,10 +94,12 @@ class BeamNGBridge(object):
         self._setup_services()
         self._publishers = list()
         self._vehicle_publisher = None
+        self._publishers_generation = 0
         self._static_tf_frames: list = []
         self._static_tf_broadcaster = tf2_ros.StaticTransformBroadcaster()
         self._setup_sensor_defs(sensor_paths)
 
+        self._feedback_pool = ThreadPoolExecutor(max_workers=1)
         self._stepAS = actionlib.SimpleActionServer(f'{NODE_NAME}/step',
                                                     bng_msgs.StepAction,
                                                     execute_cb=self.step,
@@ -68,20 +109,14 @@ class BeamNGBridge(object):
         self._stepAS.start()
         self._marker_idx = 0
         self.network_publisher = None
+        self._scenario_hash = None
+        self._scenario_path = None
 
     def _setup_sensor_defs(self, sensor_paths):
         default_path = ['/config/sensors.json']
         sensor_paths = default_path if not sensor_paths else sensor_paths
-        print("------------")
-        print("------------")
-        print("sensor_paths", sensor_paths)
-        print("------------")
-        print("------------")
-        sensor_defs = dict()
-        for path in sensor_paths:
-            s = load_json(path)
-            sensor_defs.update(s)
-        self._sensor_defs = sensor_defs
+        rospy.logdebug("sensor_paths: %s", sensor_paths)
+        self._sensor_defs = {k: v for path in sensor_paths for k, v in load_json(path).items()}
 
     def _setup_services(self):
         self.add_service('get_scenario_state',
@@ -116,42 +151,50 @@ class BeamNGBridge(object):
         self._marker_idx += 1
         return m
 
-    def get_sensor_classical_from_dict(self, v_spec, vehicle):
-        sensor_collection = list()
-        noise_sensors = list()
-        if 'sensors_classical' in v_spec:
-            for spec in v_spec['sensors_classical']:
-                if 'base sensor' in spec:
-                    noise_sensors.append(spec)
-                else:
-                    sensor_collection.append(spec)
-        rospy.logdebug(f'sensors_classical: {sensor_collection}')
-        rospy.logdebug(f'noise_classical: {noise_sensors}')
+    def _setup_sensors(self, sensor_collection, vehicle, on_sensor):
+        """
+        Creates a sensor for every specification and hands it to
+        on_sensor(s_spec, vehicle, sensor, sensor_publisher) for registration.
+        """
         for s_spec in sensor_collection:
-            s_name = s_spec.pop('name')
-            s_type = s_spec.pop('type')
+            dyn_spec = {k: v for k, v in s_spec.items() if k not in ('name', 'type', 'publish_rate')}
+            s_type = s_spec['type']
             rospy.logdebug(f'Attempting to set up {s_type} sensor.')
-            sensor = get_sensor(self.game_client,
-                                vehicle,
-                                s_type,
-                                self._sensor_defs,
-                                dyn_sensor_properties=s_spec)
-            vehicle.attach_sensor(s_name, sensor)
+            sensor, sensor_publisher = get_sensor(s_type,
+                                                  self._sensor_defs,
+                                                  bng=self.game_client,
+                                                  vehicle=vehicle,
+                                                  name=s_spec['name'],
+                                                  dyn_sensor_properties=dyn_spec)
+            on_sensor(s_spec, vehicle, sensor, sensor_publisher)
+
+    def get_sensor_classical_from_dict(self, v_spec, vehicle, partition=None):
+        if partition is None:
+            partition = partition_sensor_specs(v_spec)
+        sensor_collection, noise_sensors = partition['sensors_classical']
+        rospy.logdebug(f'sensors_classical: {sensor_collection}')
+        rospy.logdebug(f'noise_classical: {noise_sensors}')
+
+        def attach(s_spec, vehicle, sensor, sensor_publisher):
+            vehicle.attach_sensor(s_spec['name'], sensor)
+
+        self._setup_sensors(sensor_collection, vehicle, attach)
         for n_spec in noise_sensors:
-            n_name = n_spec.pop('name')
-            n_type = n_spec.pop('type')
-            sensor = n_spec.pop('base sensor')
-            if sensor in vehicle.sensors:
-                sensor = vehicle.sensors[sensor]
-            else:
-                rospy.logerr(f'Could not find sensor with id {sensor} to '
+            n_type = n_spec['type']
+            base_sensor = n_spec['base sensor']
+            if base_sensor not in vehicle.sensors:
+                rospy.logerr(f'Could not find sensor with id {base_sensor} to '
                              f'generate noise sensor of type {n_type}')
-            n_spec['sensor'] = sensor
-            noise = get_sensor(self.game_client,
-                               n_type,
-                               self._sensor_defs,
-                               dyn_sensor_properties=n_spec)
-            vehicle.attach_sensor(n_name, noise)
+                continue
+            dyn_spec = {k: v for k, v in n_spec.items() if k not in ('name', 'type', 'base sensor')}
+            dyn_spec['sensor'] = vehicle.sensors[base_sensor]
+            noise, _ = get_sensor(n_type,
+                                  self._sensor_defs,
+                                  bng=self.game_client,
+                                  vehicle=vehicle,
+                                  name=n_spec['name'],
+                                  dyn_sensor_properties=dyn_spec)
+            vehicle.attach_sensor(n_spec['name'], noise)
         return vehicle
 
     @staticmethod
@@ -164,53 +207,35 @@ class BeamNGBridge(object):
         static_transform_stamped.transform.translation.y = float(translation[1])
         static_transform_stamped.transform.translation.z = float(translation[2])
 
-        quat = tf.transformations.quaternion_from_euler(float(0),
-                                                        float(rotation[0]),
-                                                        float(rotation[1]))  # RPY to convert
-
-        alignment_quat = np.array([0, 0, 0, 1])  # sets the forward direction as -y
-        # alignment_quat = np.array([0, 1, 0, 0])  # sets the forward direction as -y
-        quat = quaternion_multiply(alignment_quat, quat)
-        quat /= np.linalg.norm(quat)
+        quat = sensor_quaternion(float(rotation[0]), float(rotation[1]))
         static_transform_stamped.transform.rotation.x = quat[0]
         static_transform_stamped.transform.rotation.y = quat[1]
         static_transform_stamped.transform.rotation.z = quat[2]
         static_transform_stamped.transform.rotation.w = quat[3]
         return static_transform_stamped
 
-    def set_sensor_automation_from_dict(self, scenario_spec, vehicle_list):
-        for v_spec, vehicle in zip(scenario_spec['vehicles'], vehicle_list):
-            sensor_collection = list()
-            noise_sensors = list()
-            if 'sensors_automation' in v_spec:
-                for spec in v_spec['sensors_automation']:
-                    if 'base sensor' in spec:
-                        noise_sensors.append(spec)
-                    else:
-                        sensor_collection.append(spec)
+    def _add_automation_publisher(self, s_spec, vehicle, sensor, sensor_publisher):
+        if sensor_publisher is None:
+            return
+        name = s_spec['name']
+        static_sensor_frame = self.get_stamped_static_tf_frame(translation=s_spec['position'],
+                                                               rotation=s_spec['rotation'],
+                                                               vehicle_name=vehicle.vid,
+                                                               sensor_name=name)
+        self._static_tf_frames.append(static_sensor_frame)
+        publisher = sensor_publisher(sensor, f"{NODE_NAME}/{vehicle.vid}/{name}", vehicle)
+        if s_spec.get('publish_rate'):
+            publisher.rate = s_spec['publish_rate']
+        self._publishers.append(publisher)
+
+    def set_sensor_automation_from_dict(self, scenario_spec, vehicle_list, sensor_partitions=None):
+        if sensor_partitions is None:
+            sensor_partitions = [partition_sensor_specs(v_spec) for v_spec in scenario_spec['vehicles']]
+        for partition, vehicle in zip(sensor_partitions, vehicle_list):
+            sensor_collection, noise_sensors = partition['sensors_automation']
             rospy.logdebug(f'sensors_automation: {sensor_collection}')
             rospy.logdebug(f'noise_automation: {noise_sensors}')
-            for s_spec in sensor_collection:
-                dyn_spec = copy.deepcopy(s_spec)
-                dyn_spec.pop("name")
-                dyn_spec.pop("type")
-                s_type = s_spec["type"]
-                name = s_spec["name"]
-
-                rospy.logdebug(f'Attempting to set up {s_type} sensor.')
-                sensor, sensor_publisher = get_sensor(s_type,
-                                                      self._sensor_defs,
-                                                      bng=self.game_client,
-                                                      vehicle=vehicle,
-                                                      name=name,
-                                                      dyn_sensor_properties=dyn_spec)
-                if sensor_publisher is not None:
-                    static_sensor_frame = self.get_stamped_static_tf_frame(translation=s_spec['position'],
-                                                                           rotation=s_spec['rotation'],
-                                                                           vehicle_name=vehicle.vid,
-                                                                           sensor_name=name)
-                    self._static_tf_frames.append(static_sensor_frame)
-                    self._publishers.append(sensor_publisher(sensor, f"{NODE_NAME}/{vehicle.vid}/{name}", vehicle))
+            self._setup_sensors(sensor_collection, vehicle, self._add_automation_publisher)
             # for n_spec in noise_sensors:
             #     n_name = n_spec.pop('name')
             #     n_type = n_spec.pop('type')
@@ -238,18 +263,21 @@ class BeamNGBridge(object):
         except FileNotFoundError:
             rospy.logerr(f'file "{file_name}" does not exist, abort')
             return
-        rospy.loginfo(json.dumps(scenario_spec))
+        if logging.getLogger('rosout').isEnabledFor(logging.DEBUG):
+            rospy.logdebug(json.dumps(scenario_spec))
         return scenario_spec
 
-    def decode_scenario(self, scenario_spec):
+    def decode_scenario(self, scenario_spec, sensor_partitions=None):
         vehicle_list = list()
         scenario = bngpy.Scenario(scenario_spec.pop('level'),
                                   scenario_spec.pop('name'))
+        if sensor_partitions is None:
+            sensor_partitions = [partition_sensor_specs(v_spec) for v_spec in scenario_spec['vehicles']]
 
-        for v_spec in scenario_spec['vehicles']:
+        for v_spec, partition in zip(scenario_spec['vehicles'], sensor_partitions):
             vehicle = self.get_vehicle_from_dict(v_spec)
             # set up classical sensors
-            vehicle = self.get_sensor_classical_from_dict(v_spec, vehicle)
+            vehicle = self.get_sensor_classical_from_dict(v_spec, vehicle, partition)
             self._vehicle_publisher = VehiclePublisher(vehicle, NODE_NAME)  # we need this to be published first for tf
             scenario.add_vehicle(vehicle,
                                  pos=v_spec['position'],
@@ -259,12 +287,12 @@ class BeamNGBridge(object):
 
         on_scenario_start = list()
         wp_key = 'weather_presets'
-        if wp_key in scenario_spec.keys():
+        if wp_key in scenario_spec:
             def weather_presets():
                 self.game_client.set_weather_preset(scenario_spec[wp_key])
 
             on_scenario_start.append(weather_presets)
-        if 'time_of_day' in scenario_spec.keys():
+        if 'time_of_day' in scenario_spec:
             def tod():
                 self.game_client.set_tod(scenario_spec['time_of_day'])
 
@@ -276,26 +304,62 @@ class BeamNGBridge(object):
 
     def start_scenario(self, file_name):
         self._publishers = list()
+        self._vehicle_publisher = None
+        self._static_tf_frames = list()
+        # stop publishing the previous scenario while the new one loads
+        self._publishers_generation += 1
         scenario_spec = self._scenario_from_json(file_name)
         if not scenario_spec:
             return
-        scenario, on_scenario_start, vehicle_list = self.decode_scenario(scenario_spec)
-        scenario.make(self.game_client)
-        self.game_client.load_scenario(scenario)
-        self.game_client.start_scenario()
-        # Automation sensors need to be set up after the scenario starts
-        self.set_sensor_automation_from_dict(scenario_spec, vehicle_list)
-        for hook in on_scenario_start:
-            hook()
-
-        if 'mode' in scenario_spec.keys() and scenario_spec['mode'] == 'paused':
-            rospy.logdebug("paused scenario")
-            self.game_client.pause()
-        else:
-            rospy.logdebug("non paused scenario")
+        spec_hash = hashlib.sha1(json.dumps(scenario_spec, sort_keys=True).encode()).hexdigest()
+        # split the sensor specs once, both sensor setup passes reuse it
+        sensor_partitions = [partition_sensor_specs(v_spec) for v_spec in scenario_spec['vehicles']]
+        scenario, on_scenario_start, vehicle_list = self.decode_scenario(scenario_spec, sensor_partitions)
+        # in-flight publishers of the previous scenario may still poll
+        with BNG_IO_LOCK:
+            loaded = False
+            if spec_hash == self._scenario_hash:
+                # the scenario files of an identical spec may still be on disk.
+                # The fallback below only triggers if the simulator answers a
+                # missing scenario with an error, if it does not reply at all,
+                # load_scenario blocks like any other unanswered request.
+                scenario.path = self._scenario_path
+                try:
+                    self.game_client.load_scenario(scenario)
+                    loaded = True
+                except (bngpy.logging.BNGError, bngpy.logging.BNGValueError) as e:
+                    rospy.logwarn(f'Could not reload scenario from "{self._scenario_path}", '
+                                  f'regenerating it: {e}')
+                    self._scenario_hash = None
+                    scenario.path = None
+            if not loaded:
+                scenario.make(self.game_client)
+                self._scenario_hash = spec_hash
+                self._scenario_path = scenario.path
+                self.game_client.load_scenario(scenario)
+            self.game_client.start_scenario()
+            # Automation sensors need to be set up after the scenario starts
+            self.set_sensor_automation_from_dict(scenario_spec, vehicle_list, sensor_partitions)
+            self.publish_static_tf_frames()
+            for hook in on_scenario_start:
+                hook()
+
+            if 'mode' in scenario_spec and scenario_spec['mode'] == 'paused':
+                rospy.logdebug("paused scenario")
+                self.game_client.pause()
+            else:
+                rospy.logdebug("non paused scenario")
         rospy.loginfo(f'Started scenario "{scenario.name}".')
+        self._publishers_generation += 1
         self.running = True
 
+    def publish_static_tf_frames(self):
+        # static transforms are latched on /tf_static, sending them once suffices
+        current_time = rospy.Time.now()
+        for static_tf in self._static_tf_frames:
+            static_tf.header.stamp = current_time
+        self._static_tf_broadcaster.sendTransform(self._static_tf_frames)
+
     def start_scenario_from_req(self, req):
         self.start_scenario(req.path_to_scenario_definition)
         response = bng_srv.StartScenarioResponse()
@@ -308,18 +372,19 @@ class BeamNGBridge(object):
         response.state.running = False
         response.state.scenario_name = ""
         response.state.level_name = ""
-        game_state = self.game_client.get_gamestate()
         response.state.vehicle_ids = []
-        if game_state['state'] == 'scenario':
-            response.state.loaded = True
-            response.state.level_name = game_state['level']
-            vehicles = self.game_client.get_current_vehicles()
-            vehicles = list(vehicles.keys())
-            response.state.vehicle_ids = vehicles
-            if 'scenario_state' in game_state.keys():
-                if game_state['scenario_state'] == 'running':
-                    response.state.running = True
-                response.state.scenario_name = self.game_client.get_scenario_name()
+        with BNG_IO_LOCK:
+            game_state = self.game_client.get_gamestate()
+            if game_state['state'] == 'scenario':
+                response.state.loaded = True
+                response.state.level_name = game_state['level']
+                vehicles = self.game_client.get_current_vehicles()
+                vehicles = list(vehicles.keys())
+                response.state.vehicle_ids = vehicles
+                if 'scenario_state' in game_state:
+                    if game_state['scenario_state'] == 'running':
+                        response.state.running = True
+                    response.state.scenario_name = self.game_client.get_scenario_name()
         return response
 
     def spawn_new_vehicle(self, req):
@@ -342,10 +407,11 @@ class BeamNGBridge(object):
             return response
         vehicle_spec['name'] = req.name
         vehicle = self.get_vehicle_from_dict(vehicle_spec)
-        self.game_client.spawn_vehicle(vehicle,
-                                       req.pos,
-                                       None,
-                                       rot_quat=req.rot_quat)
+        with BNG_IO_LOCK:
+            self.game_client.spawn_vehicle(vehicle,
+                                           req.pos,
+                                           None,
+                                           rot_quat=req.rot_quat)
         response.success = True
         return response
 
@@ -360,9 +426,10 @@ class BeamNGBridge(object):
             rospy.logerr('rotation param does not fit '
                          f'required quaternion format:{str(req.rot_quat)}')
             return response
-        success = self.game_client.teleport_vehicle(req.vehicle_id,
-                                                    req.pos, rot=None,
-                                                    rot_quat=req.rot_quat)
+        with BNG_IO_LOCK:
+            success = self.game_client.teleport_vehicle(req.vehicle_id,
+                                                        req.pos, rot=None,
+                                                        rot_quat=req.rot_quat)
         if success:
             response.success = True
         return response
@@ -370,7 +437,8 @@ class BeamNGBridge(object):
     def get_current_vehicles(self, req):
         response = bng_srv.GetCurrentVehiclesInfoResponse()
         vehicles = list()
-        list_of_current_vehicles = self.game_client.get_current_vehicles_info()
+        with BNG_IO_LOCK:
+            list_of_current_vehicles = self.game_client.get_current_vehicles_info()
         for veh in list_of_current_vehicles.values():
             veh_inf = bng_msgs.VehicleInfo()
             veh_inf.vehicle_id = veh['name']
@@ -382,8 +450,9 @@ class BeamNGBridge(object):
     def pause(self, req):
         response = bng_srv.ChangeSimulationStateResponse()
         try:
-            self.game_client.pause()
-        except bngpy.beamngcommon.BNGError:
+            with BNG_IO_LOCK:
+                self.game_client.pause()
+        except bngpy.logging.BNGError:
             rospy.logerr('No confirmation available, '
                          'simulation may or may not have paused.')
             response.success = False
@@ -394,8 +463,9 @@ class BeamNGBridge(object):
     def resume(self, req):
         response = bng_srv.ChangeSimulationStateResponse()
         try:
-            self.game_client.resume()
-        except bngpy.beamngcommon.BNGError:
+            with BNG_IO_LOCK:
+                self.game_client.resume()
+        except bngpy.logging.BNGError:
             rospy.logerr('No confirmation available, '
                          'simulation may or may not have resumed.')
             response.success = False
@@ -406,79 +476,129 @@ class BeamNGBridge(object):
     def step(self, goal):
         success = True
 
-        feedback = bng_msgs.StepFeedback()
-
         step_counter = 0
         imax = goal.total_number_of_steps // goal.feedback_cycle_size
         rest = goal.total_number_of_steps % goal.feedback_cycle_size
-        imax = imax + 1 if rest else imax
-
-        for i in range(0, imax):
+        step_sizes = [goal.feedback_cycle_size] * imax
+        if rest:
+            step_sizes.append(rest)
+
+        # feedback is published in the background while the next block of
+        # steps runs, the single worker keeps the feedback messages in order
+        feedback_future = None
+        for step_size in step_sizes:
             if self._stepAS.is_preempt_requested():
-                self._stepAS.set_preempted()
                 success = False
-                rospy.loginfo("Step action preempted: completed "
-                              f"{step_counter}/{goal.total_number_of_steps} "
-                              "steps")
                 break
-            steps_to_finish = goal.total_number_of_steps - step_counter
-            step_size = min(steps_to_finish, goal.feedback_cycle_size)
-            self.game_client.step(step_size)
+            with BNG_IO_LOCK:
+                self.game_client.step(step_size)
             step_counter += step_size
             rospy.logdebug(f"took {step_counter}/"
                            f"{goal.total_number_of_steps} steps")
+            feedback = bng_msgs.StepFeedback()
             feedback.steps_completed = step_counter
-            self._stepAS.publish_feedback(feedback)
+            feedback_future = self._feedback_pool.submit(self._stepAS.publish_feedback, feedback)
+            feedback_future.add_done_callback(self._log_publish_error)
 
+        if feedback_future is not None:
+            wait([feedback_future])
         if success:
             rospy.loginfo(f"completed goal, performed {step_counter} steps")
             result = bng_msgs.StepResult()
             result.success = True
             self._stepAS.set_succeeded(result)
+        else:
+            self._stepAS.set_preempted()
+            rospy.loginfo("Step action preempted: completed "
+                          f"{step_counter}/{goal.total_number_of_steps} "
+                          "steps")
 
     def get_roads(self):
-        roads = self.game_client.get_roads()
         road_spec = {}
-        for r_id, r_inf in roads.items():
-            if r_inf['drivability'] != '-1':
-                road_spec[r_id] = self.game_client.get_road_edges(r_id)
+        with BNG_IO_LOCK:
+            roads = self.game_client.get_roads()
+            for r_id, r_inf in roads.items():
+                if r_inf['drivability'] != '-1':
+                    road_spec[r_id] = self.game_client.get_road_edges(r_id)
 
         network = list()
-        for r_id in road_spec.keys():
-            left = list()
-            right = list()
-            for r_point in road_spec[r_id]:
-                left.append(r_point['left'])
-                right.append(r_point['right'])
+        for edges in road_spec.values():
+            left = [r_point['left'] for r_point in edges]
+            right = [r_point['right'] for r_point in edges]
             if left:
                 network.append(left)
             if right:
                 network.append(right)
         return network
 
+    @staticmethod
+    def _log_publish_error(future):
+        error = future.exception()
+        if error is not None:
+            rospy.logerr(f'Publishing failed: {error}')
+
     def work(self):
-        ros_rate = 10
-        rate = rospy.Rate(ros_rate)  # todo add threading
         if self.running:
-
-            while not rospy.is_shutdown():
-                current_time = rospy.Time.now()
-                for static_tf in self._static_tf_frames:
-                    static_tf.header.stamp = current_time
-                    self._static_tf_broadcaster.sendTransform(static_tf)
-                if self._vehicle_publisher is not None:
-                    self._vehicle_publisher.publish(current_time)
-                for pub in self._publishers:
-                    pub.publish(current_time)
-                rate.sleep()
+            # sensor publishers run on their own worker so a slow sensor does
+            # not hold back the others, a publisher still busy skips its turn
+            pending = dict()
+            generation = None
+            pool = None
+            # bind loop lookups to locals once
+            is_shutdown = rospy.is_shutdown
+            now = rospy.Time.now
+            get_pending = pending.get
+            log_error = self._log_publish_error
+            try:
+                while not is_shutdown():
+                    if generation != self._publishers_generation:
+                        # a scenario was (re)started, pick up its publishers
+                        generation = self._publishers_generation
+                        vehicle_publisher = self._vehicle_publisher
+                        publishers = list(self._publishers)
+                        rates = [pub.rate for pub in publishers]
+                        if vehicle_publisher is not None:
+                            rates.append(vehicle_publisher.rate)
+                        # run at the rate of the fastest publisher, each one only publishes when due
+                        sleep = rospy.Rate(max(rates, default=10)).sleep
+                        if pool is not None:
+                            pool.shutdown(wait=False)
+                        pool = ThreadPoolExecutor(max_workers=max(len(publishers), 1))
+                        submit = pool.submit
+                        pending.clear()
+                    current_time = now()
+                    # the vehicle pose is published before the sensors for tf
+                    if vehicle_publisher is not None and vehicle_publisher.is_due(current_time):
+                        vehicle_publisher.publish(current_time)
+                        vehicle_publisher.schedule_next(current_time)
+                    for pub in publishers:
+                        future = get_pending(pub)
+                        if future is not None and not future.done():
+                            continue
+                        if pub.is_due(current_time):
+                            future = submit(pub.publish, current_time)
+                            future.add_done_callback(log_error)
+                            pending[pub] = future
+                            pub.schedule_next(current_time)
+                    sleep()
+            finally:
+                if pool is not None:
+                    pool.shutdown()
 
     def on_shutdown(self):
         rospy.loginfo("Shutting down beamng_control/bridge.py node")
-        self.game_client.disconnect()
+        self._feedback_pool.shutdown(wait=False)
+        with BNG_IO_LOCK:
+            self.game_client.disconnect()
 
 
 def main():
     rospy.init_node(NODE_NAME, anonymous=True, log_level=rospy.DEBUG)
+    log_level = rospy.get_param('beamng/log_level', 'debug')
+    try:
+        logging.getLogger('rosout').setLevel(log_level.upper())
+    except ValueError:
+        rospy.logwarn(f'Unknown log level "{log_level}", keeping debug.')
     node_name = rospy.get_name()
     rospy.loginfo(f'Started node "{node_name}".')
 
@@ -495,7 +615,7 @@ def main():
     rospy.loginfo("cmd args" + str(argv))
 
     params = rospy.get_param("beamng")
-    if not ('host' in params.keys() and 'port' in params.keys()):
+    if not ('host' in params and 'port' in params):
         rospy.logfatal("No host or port specified on parameter server "
                        "to connect to Beamng.tech")
         sys.exit()
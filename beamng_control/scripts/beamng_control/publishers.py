@@ -26,6 +26,9 @@ from visualization_msgs.msg import Marker, MarkerArray
 import beamng_msgs.msg as bng_msgs
 from beamngpy.sensors import Camera
 
+# BeamNGpy shares one socket per connection, requests must not interleave
+BNG_IO_LOCK = threading.RLock()
+
 
 def get_sensor_publisher(sensor):
     sensor_mapping = {
@@ -48,6 +51,23 @@ def get_sensor_publisher(sensor):
 
 
 class BNGPublisher(ABC):
+    rate = 10  # Hz
+    next_time = rospy.Time(0)
+
+    @property
+    def period(self):
+        return rospy.Duration(1. / self.rate)
+
+    def is_due(self, current_time):
+        # half a period of slack absorbs the wake-up jitter of rospy.Rate
+        return current_time >= self.next_time - self.period * 0.5
+
+    def schedule_next(self, current_time):
+        # advance from the previous deadline so wake-up delays don't add up,
+        # resync if we fell more than one period behind
+        self.next_time += self.period
+        if self.next_time <= current_time:
+            self.next_time = current_time + self.period
 
     @abstractmethod
     def publish(self, current_time):
@@ -349,8 +369,9 @@ class BBoxImgPublisher(CameraDataPublisher):
 
     def _update_data_with_bbox(self, data):
         if self._classes is None:
-            annotations = self._vehicle.bng.get_annotations()
-            self._classes = self._vehicle.bng.get_annotation_classes(annotations)
+            with BNG_IO_LOCK:
+                annotations = self._vehicle.bng.get_annotations()
+                self._classes = self._vehicle.bng.get_annotation_classes(annotations)
         bboxes = Camera.extract_bounding_boxes(data['annotation'],
                                                data['instance'],
                                                self._classes)
@@ -415,10 +436,11 @@ class CameraPublisher(BNGPublisher):
             self._publishers.append(pub)
 
     def publish(self, current_time):
-        if self._sensor.is_render_instance:
-            data = self._sensor.get_full_poll_request()
-        else:
-            data = self._sensor.poll()
+        with BNG_IO_LOCK:
+            if self._sensor.is_render_instance:
+                data = self._sensor.get_full_poll_request()
+            else:
+                data = self._sensor.poll()
         for pub in self._publishers:
             pub.current_time = current_time
             pub.publish(current_time, data)
@@ -437,7 +459,8 @@ class LidarPublisher(SensorDataPublisher):
         header.frame_id = self.frame_lidar_sensor
         header.stamp = self.current_time
 
-        readings_data = self._sensor.poll()
+        with BNG_IO_LOCK:
+            readings_data = self._sensor.poll()
         points = np.array(readings_data['pointCloud'])
         colours = readings_data['colours']
 
@@ -447,7 +470,9 @@ class LidarPublisher(SensorDataPublisher):
                              ('intensity', np.float32)]
 
         try:
-            (trans_map, _) = self.listener.lookupTransform(self.frame_map, self.frame_lidar_sensor, header.stamp)
+            # the vehicle pose may be published at a lower rate than the lidar,
+            # use the latest available transform rather than the exact stamp
+            (trans_map, _) = self.listener.lookupTransform(self.frame_map, self.frame_lidar_sensor, rospy.Time(0))
         except (tf.LookupException, tf.ConnectivityException, tf.ExtrapolationException) as e:
             rospy.logwarn(f'No transform between {self.frame_map} and '
                           f'{self.frame_lidar_sensor} available with exception: {e}')
@@ -554,7 +579,8 @@ class VehiclePublisher(BNGPublisher):
 
     def publish(self, current_time):
         self.current_time = current_time
-        self._vehicle.poll_sensors()
+        with BNG_IO_LOCK:
+            self._vehicle.poll_sensors()
         self.broadcast_vehicle_pose(self._vehicle.sensors['state'].data)
         for pub in self._sensor_publishers:  # this got us 1fps more
             threading.Thread(target=pub.publish, args=(current_time,), daemon=True).start()
@@ -576,11 +602,12 @@ class NetworkPublisher(BNGPublisher):
         self.current_time = rospy.get_rostime()
 
     def set_up_road_network_viz(self):
-        roads = self._game_client.get_roads()
-        network_def = dict()
-        for r_id, r_inf in roads.items():
-            if r_inf['drivability'] != '-1':
-                network_def[int(r_id)] = self._game_client.get_road_edges(r_id)
+        with BNG_IO_LOCK:
+            roads = self._game_client.get_roads()
+            network_def = dict()
+            for r_id, r_inf in roads.items():
+                if r_inf['drivability'] != '-1':
+                    network_def[int(r_id)] = self._game_client.get_road_edges(r_id)
 
         self._road_network = MarkerArray()
         for r_id, road in network_def.items():
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import random
+import unittest
+
+import rospy
+
+from beamng_control.publishers import BNGPublisher
+
+
+class DummyPublisher(BNGPublisher):
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.published = 0
+
+    def publish(self, current_time):
+        self.published += 1
+
+
+def run_loop(pub, loop_rate, ticks, max_jitter=0.002, seed=0):
+    """
+    Simulates the work() loop of the bridge, every tick wakes up late by a
+    random amount of up to max_jitter seconds.
+    """
+    rng = random.Random(seed)
+    for i in range(ticks):
+        current_time = rospy.Time.from_sec(100 + i / loop_rate + rng.uniform(0, max_jitter))
+        if pub.is_due(current_time):
+            pub.publish(current_time)
+            pub.schedule_next(current_time)
+    return pub.published
+
+
+class TestBNGPublisherSchedule(unittest.TestCase):
+
+    def test_first_tick_is_due(self):
+        pub = DummyPublisher(10)
+        self.assertTrue(pub.is_due(rospy.Time.from_sec(100)))
+
+    def test_not_due_right_after_publishing(self):
+        pub = DummyPublisher(10)
+        now = rospy.Time.from_sec(100)
+        pub.schedule_next(now)
+        self.assertFalse(pub.is_due(now + rospy.Duration(0.01)))
+        self.assertTrue(pub.is_due(now + rospy.Duration(0.1)))
+
+    def test_rate_equal_to_loop_rate_publishes_every_tick(self):
+        pub = DummyPublisher(10)
+        self.assertEqual(run_loop(pub, loop_rate=10, ticks=1000), 1000)
+
+    def test_slower_publisher_is_decimated(self):
+        pub = DummyPublisher(10)
+        self.assertAlmostEqual(run_loop(pub, loop_rate=30, ticks=3000), 1000, delta=1)
+
+    def test_resync_after_stall(self):
+        pub = DummyPublisher(10)
+        now = rospy.Time.from_sec(100)
+        pub.schedule_next(now)
+        later = now + rospy.Duration(5)
+        self.assertTrue(pub.is_due(later))
+        pub.schedule_next(later)
+        # deadlines do not pile up, the next publish is one period away
+        self.assertFalse(pub.is_due(later + rospy.Duration(0.01)))
+        self.assertEqual(pub.next_time, later + pub.period)
+
+
+if __name__ == '__main__':
+    unittest.main()